@@ -10,12 +10,14 @@ class Election_Analyzer(IElection_Analyzer):
     """
         Initializes the Election Analyzer object holding all useful information including a pandas dataframe of the final parliament distribution.
 
-        @param  instance  a loaded json-file found in the Instances directory, specifying the data used.
+        @param  instance        a loaded json-file found in the Instances directory, specifying the data used.
+        @param  district_data   dataframe with columns [District, Mandates] used instead of the instance's district data,
+                                e.g. from Apportionment.find_district_mandates(). Default value None.
     """
-    def __init__(self, instance):
+    def __init__(self, instance, district_data = None):
 
         # Dataframes for the raw data found in the instance
-        self.election_data, self.district_data, self.party_data = Tools.create_dataframes(instance)
+        self.election_data, self.district_data, self.party_data = Tools.create_dataframes(instance, district_data)
         
         # Dataframes for all parties and districts
         self.parties = self.election_data[self.election_data["District"] == self.election_data.loc[0]["District"]]["Party"]
@@ -128,7 +130,11 @@ class Election_Analyzer(IElection_Analyzer):
         @return         a dictionary {district: [mandates_party1, ... , mandates_partyN], ...} with the mandates per party per district.
                         Both the districts and the parties are organised in alphabetical order (as in the data files).
     """
-    def find_mandates_at_large(self, mandates_from_district, overrepresented_parties = []):
+    def find_mandates_at_large(self, mandates_from_district, overrepresented_parties = None):
+
+        # New list for every analysis, as the list is extended while searching for overrepresented parties
+        if overrepresented_parties is None:
+            overrepresented_parties = []
         
         """ National mandate distribution
                 - Like find_district_mandate_distribution() but with the entire nation as one district, not for each district. 
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+
+"""
+    Class apportioning the mandates of the parliament among the districts from their population and area.
+
+    In Norway the number of mandates in each district is derived from a district's points, where every inhabitant
+    counts one point and every square kilometre counts 1.8 points. The mandates are distributed among the districts
+    using the Sainte-Laguë method (divisors 1, 3, 5, 7...). Every census year and area weight is treated as a separate
+    scenario, and all scenarios are apportioned at once.
+"""
+class Apportionment:
+
+    """
+        Calculates the points of each district for every census year and area weight.
+
+        @param  population_data     dataframe with columns [District, Year, Population, Area].
+        @param  area_weights        list of points given per square kilometre. Default value (1.8,).
+        @return                     list of census years in ascending order.
+        @return                     list of districts in the order of the data file.
+        @return                     numpy array of shape (years, area weights, districts) with the points per district.
+    """
+    @staticmethod
+    def find_district_points(population_data, area_weights = (1.8,)):
+        years = sorted(population_data["Year"].unique().tolist())
+        districts = population_data["District"].unique().tolist()
+
+        # Population and area as (years, districts) tables. Missing districts in a year give an error rather than zero points
+        population = population_data.pivot(index="Year", columns="District", values="Population").loc[years, districts]
+        area = population_data.pivot(index="Year", columns="District", values="Area").loc[years, districts]
+        if population.isna().any().any() or area.isna().any().any():
+            raise ValueError("Population data must contain population and area of every district for every year.")
+
+        # Points = population + area_weight * area, broadcast over the area weights
+        weights = np.asarray(area_weights, dtype=float)
+        points = population.to_numpy(dtype=float)[:, None, :] + weights[None, :, None] * area.to_numpy(dtype=float)[:, None, :]
+        return years, districts, points
+
+
+    """
+        Distributes the mandates among the districts using the Sainte-Laguë method for every scenario at once.
+
+        Ties are broken in favour of the district appearing first, while Norwegian law breaks ties by lot.
+
+        @param  points              numpy array of shape (..., districts) with the points per district.
+        @param  total_mandates      number of mandates to distribute among the districts in each scenario.
+        @return                     numpy array of the same shape as points with the mandates per district.
+    """
+    @staticmethod
+    def find_sainte_lague_distribution(points, total_mandates):
+        points = np.asarray(points, dtype=float)
+        mandates = np.zeros(points.shape, dtype=int)
+
+        # Flatten all scenarios to rows so one mandate can be given to every scenario per iteration
+        flat_points = points.reshape(-1, points.shape[-1])
+        flat_mandates = mandates.reshape(-1, points.shape[-1])
+        rows = np.arange(flat_points.shape[0])
+
+        # Give the mandate to the district with the highest quotient. Divided by 1, 3, 5, 7...
+        for _ in range(total_mandates):
+            quotients = flat_points / (2 * flat_mandates + 1)
+            flat_mandates[rows, quotients.argmax(axis=1)] += 1
+        return mandates
+
+
+    """
+        Calculates the mandates per district for every census year and area weight.
+
+        @param  population_data     dataframe with columns [District, Year, Population, Area].
+        @param  total_mandates      number of mandates in the parliament. Default value 169.
+        @param  area_weights        list of distinct points given per square kilometre. Default value (1.8,).
+        @param  minimum_mandates    fewest mandates a district may receive. The Modified Sainte-Laguë method uses one mandate
+                                    in every district as a mandate at large and needs at least 2. Default value 2.
+        @return                     dictionary {(year, area_weight): district_data, ...} where district_data is a dataframe
+                                    with columns [District, Mandates] that can be given directly to an Election_Analyzer.
+                                    Ties are broken in favour of the district appearing first in population_data.
+    """
+    @staticmethod
+    def find_district_mandates(population_data, total_mandates = 169, area_weights = (1.8,), minimum_mandates = 2):
+        if len(set(area_weights)) != len(area_weights):
+            raise ValueError("Area weights must be distinct, got " + str(list(area_weights)) + ".")
+
+        years, districts, points = Apportionment.find_district_points(population_data, area_weights)
+        mandates = Apportionment.find_sainte_lague_distribution(points, total_mandates)
+
+        # Districts with too few mandates cannot be analyzed by all electoral systems
+        too_few_mandates = mandates < minimum_mandates
+        if too_few_mandates.any():
+            i, j, k = np.argwhere(too_few_mandates)[0]
+            raise ValueError(str(districts[k]) + " receives " + str(mandates[i, j, k]) + " mandates in " + str(years[i]) + " with area weight "
+                             + str(area_weights[j]) + ", but every district needs at least " + str(minimum_mandates) + " mandates.")
+
+        district_mandates = {}
+        for i, year in enumerate(years):
+            for j, area_weight in enumerate(area_weights):
+                district_mandates[(year, area_weight)] = pd.DataFrame({"District": districts, "Mandates": mandates[i, j]})
+        return district_mandates
+
+
+"""
+    Example checking the Sainte-Laguë distribution against a hand-computed result.
+    Run from the Support directory with: python Apportionment.py
+"""
+if __name__ == "__main__":
+
+    # Quotients: A 53000, 17667, 10600...  B 24000, 8000, 4800...  C 23000, 7667, 4600...
+    # The 7 highest give A 3, B 2 and C 2 mandates. Scaling the points does not change the result.
+    points = np.array([[53000, 24000, 23000], [530, 240, 230]])
+    mandates = Apportionment.find_sainte_lague_distribution(points, 7)
+    assert (mandates == [[3, 2, 2], [3, 2, 2]]).all(), mandates
+
+    # Every scenario distributes all the mandates
+    population_data = pd.DataFrame({
+        "District": ["A", "B", "C"] * 2,
+        "Year": [2018] * 3 + [2022] * 3,
+        "Population": [53000, 24000, 23000, 50000, 26000, 24000],
+        "Area": [100, 2000, 500, 100, 2000, 500]
+    })
+    district_mandates = Apportionment.find_district_mandates(population_data, 20, (0, 1.8, 5))
+    for (year, area_weight), district_data in district_mandates.items():
+        assert district_data["Mandates"].sum() == 20, (year, area_weight)
+        print(year, area_weight, dict(zip(district_data["District"], district_data["Mandates"])))
@@ -0,0 +1,78 @@
+import importlib.util
+import os
+import sys
+import pandas as pd
+
+# Adds the path to Tools to sys.path so the Election_Analyzer classes can import it
+support_path = os.path.abspath(os.path.dirname(__file__))
+if support_path not in sys.path:
+    sys.path.append(support_path)
+from Apportionment import Apportionment # type: ignore
+from Tools import Tools # type: ignore
+
+
+"""
+    Class simulating every combination of district magnitudes, election data instances and electoral systems in memory.
+
+    The district magnitudes are apportioned from the population and area of the districts using the Apportionment class
+    and given directly to the Election_Analyzer of each electoral system, so no intermediate csv-files are written.
+"""
+class Grid_Simulator:
+
+    """
+        Initializes the Grid Simulator and loads the Election_Analyzer class of each electoral system.
+
+        @param  electoral_systems   list of names of the electoral systems in the ElectoralSystems directory.
+        @param  instances           list of loaded json-files found in the Instances directory, specifying the data used.
+    """
+    def __init__(self, electoral_systems, instances):
+        if len(electoral_systems) == 0:
+            raise ValueError("At least one electoral system must be given.")
+        if len(instances) == 0:
+            raise ValueError("At least one instance must be given.")
+        self.instances = instances
+        self.analyzers = {electoral_system: Grid_Simulator.load_election_analyzer(electoral_system) for electoral_system in electoral_systems}
+
+
+    """
+        Loads the Election_Analyzer class of an electoral system. Each electoral system gets its own module name, since all
+        of them are named Election_Analyzer.
+
+        @param  electoral_system    name of the electoral system in the ElectoralSystems directory.
+        @return                     the Election_Analyzer class of the electoral system.
+    """
+    @staticmethod
+    def load_election_analyzer(electoral_system):
+        file_path = os.path.join(os.path.dirname(__file__), "..", "ElectoralSystems", electoral_system, "Election_Analyzer.py")
+        spec = importlib.util.spec_from_file_location("Election_Analyzer_" + electoral_system, file_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.Election_Analyzer
+
+
+    """
+        Runs every electoral system on every instance for every census year and area weight.
+
+        @param  population_data     dataframe with columns [District, Year, Population, Area]. Value None if the
+                                    population_data_csv of each instance should be used. Default value None.
+        @param  total_mandates      number of mandates in the parliament. Default value 169.
+        @param  area_weights        list of points given per square kilometre. Default value (1.8,).
+        @return                     pandas dataframe with columns: [Instance, Year, AreaWeight, ElectoralSystem, District, Party, Mandates].
+    """
+    def run(self, population_data = None, total_mandates = 169, area_weights = (1.8,)):
+        results = []
+        for instance in self.instances:
+
+            # District magnitudes for all census years and area weights of the instance
+            instance_population_data = population_data if population_data is not None else Tools.create_population_dataframe(instance)
+            district_mandates = Apportionment.find_district_mandates(instance_population_data, total_mandates, area_weights)
+
+            for (year, area_weight), district_data in district_mandates.items():
+                for electoral_system, Election_Analyzer in self.analyzers.items():
+                    df = Election_Analyzer(instance, district_data).get_mandate_distribution().copy()
+                    df.insert(0, "ElectoralSystem", electoral_system)
+                    df.insert(0, "AreaWeight", area_weight)
+                    df.insert(0, "Year", year)
+                    df.insert(0, "Instance", instance["name"])
+                    results.append(df)
+        return pd.concat(results, ignore_index=True)
@@ -1,4 +1,5 @@
 import colorsys
+import functools
 import os
 import pandas as pd
 
@@ -64,19 +65,61 @@ class Tools:
     """
         Generates the dataframes (vote_data, district_data and party_data) of the specified instance.
 
-        @param  instance    a loaded json-file found in the Instances directory of the used electoral system, specifying the data used. 
-        @return             list of dataframes from csv-file (vote_data, district_data and party_data).
+        @param  instance        a loaded json-file found in the Instances directory of the used electoral system, specifying the data used. 
+        @param  district_data   dataframe with columns [District, Mandates] used instead of the instance's district_data_csv.
+                                The index is reset, as the analyzers look up districts by position. Value None if the
+                                csv-file should be used. Default value None.
+        @return                 list of dataframes from csv-file (vote_data, district_data and party_data).
 
     """
     @staticmethod
-    def create_dataframes(instance):
-        current_directory = os.path.dirname(__file__)
+    def create_dataframes(instance, district_data = None):
         dataframe_versions = ["Election", "District", "Party"]
         dataframes = []
         for version in dataframe_versions:
-            csv_file_path = os.path.join(current_directory, "..", "Data", version + " Data", instance["data"][version.lower() + "_data_csv"] + ".csv")
-            dataframes.append(pd.read_csv(csv_file_path))
+            if version == "District" and district_data is not None:
+                dataframes.append(district_data.reset_index(drop=True))
+            else:
+                dataframes.append(Tools.read_data_csv(version, instance["data"][version.lower() + "_data_csv"]))
+
+        # Mandates must be given for exactly the districts votes are given for
+        election_districts = set(dataframes[0]["District"])
+        districts = set(dataframes[1]["District"])
+        if districts != election_districts:
+            raise ValueError("District data does not match the election data of " + instance["name"] + ". Missing districts: "
+                             + str(sorted(election_districts - districts)) + ", unknown districts: " + str(sorted(districts - election_districts)) + ".")
         return dataframes
+
+
+    """
+        Generates the dataframe of the population and area per district per year of the specified instance.
+
+        @param  instance    a loaded json-file found in the Instances directory, specifying the data used. Must contain population_data_csv.
+        @return             dataframe from csv-file with columns [District, Year, Population, Area].
+    """
+    @staticmethod
+    def create_population_dataframe(instance):
+        if "population_data_csv" not in instance["data"]:
+            raise ValueError("No population data is configured for " + instance["name"] + ". Add population_data_csv to the instance or give the population data directly.")
+        return Tools.read_data_csv("Population", instance["data"]["population_data_csv"])
+
+
+    """
+        Reads a csv-file from the Data directory. Each file is only read once, and a copy is returned on every call.
+
+        @param  version     type of data, i.e. name of the data folder without " Data" (Election, District, Party or Population).
+        @param  name        name of the csv-file without extension.
+        @return             dataframe from csv-file.
+    """
+    @staticmethod
+    def read_data_csv(version, name):
+        return Tools._read_data_csv(version, name).copy()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _read_data_csv(version, name):
+        csv_file_path = os.path.join(os.path.dirname(__file__), "..", "Data", version + " Data", name + ".csv")
+        return pd.read_csv(csv_file_path)
     
 
     """